@@ -7,11 +7,16 @@ This minimal example demonstrates:
 - Executing a basic workflow
 """
 
+import asyncio
+import logging
 import os
+import sys
 
 from duragraph import Graph, node
 from duragraph.worker import Worker
 
+logger = logging.getLogger("hello-world")
+
 
 # Define a simple graph with two nodes
 @Graph
@@ -23,18 +28,29 @@ class HelloWorld:
         """First node: Generate greeting."""
         name = state.get("name", "World")
         state["greeting"] = f"Hello, {name}!"
-        print(f"[greet] Generated: {state['greeting']}")
+        logger.info("[greet] Generated: %s", state["greeting"])
         return state
 
     @node
     async def farewell(self, state: dict) -> dict:
         """Second node: Add farewell message."""
         state["farewell"] = "Goodbye! Thanks for using DuraGraph."
-        print(f"[farewell] Generated: {state['farewell']}")
+        logger.info("[farewell] Generated: %s", state["farewell"])
         return state
 
 
 def main():
+    # Use uvloop's faster event loop for node dispatch when it's installed
+    try:
+        import uvloop
+    except ImportError:  # optional: not available on Windows
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    # Node messages go through logging, which skips formatting when disabled
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     # Get control plane URL from environment
     control_plane_url = os.getenv("DURAGRAPH_URL", "http://localhost:8081")
 
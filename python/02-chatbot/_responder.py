@@ -0,0 +1,59 @@
+"""
+Rule-based response selection for the chatbot example.
+
+This module does no I/O and is fully annotated, so it can be compiled
+ahead of time with mypyc:
+
+    mypyc _responder.py
+
+The compiled extension is imported in place of this file when present.
+"""
+
+from typing import Final
+
+import ahocorasick  # type: ignore[import-not-found]
+
+# Canned responses and their trigger keywords, highest priority first
+RULES: Final[list[tuple[tuple[str, ...], str]]] = [
+    (("hello", "hi"), "Hello! How can I help you today?"),
+    (("how are you",), "I'm doing great, thank you for asking! How can I assist you?"),
+    (("bye", "goodbye"), "Goodbye! Feel free to come back anytime."),
+    (("name",), "I'm DuraGraph Bot, your helpful assistant!"),
+]
+
+
+def _build_rule_automaton() -> ahocorasick.Automaton:
+    """Compile every rule keyword into one automaton that yields rule priorities."""
+    automaton = ahocorasick.Automaton()
+    for priority, (keywords, _) in enumerate(RULES):
+        for keyword in keywords:
+            automaton.add_word(keyword, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+_RULE_AUTOMATON: Final = _build_rule_automaton()
+
+
+def normalize_message(text: str) -> str:
+    """Lowercase a message for keyword matching, reusing it if already lowercase."""
+    # str.lower() always builds a new string; most chat input needs no change
+    return text if text.islower() else text.lower()
+
+
+def rule_based_response(user_message: str) -> str | None:
+    """Pick a canned response for a lowercased message, or None if no rule matches."""
+    # One pass finds every keyword; the highest-priority rule wins
+    best = len(RULES)
+    for _, priority in _RULE_AUTOMATON.iter(user_message):
+        if priority < best:
+            best = priority
+            if best == 0:
+                break
+    return RULES[best][1] if best < len(RULES) else None
+
+
+def echo_response(last_content: str, message_count: int) -> str:
+    """Echo the last message back with the conversation length."""
+    return f"I understand you said: '{last_content}'. " \
+           f"This is message #{message_count} in our conversation. How can I help further?"
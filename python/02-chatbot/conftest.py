@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the chatbot tests.
+
+All tests run on one session-wide event loop (see pytest.ini) and share a
+single chatbot instance; the global store and response cache are emptied
+before each test instead.
+"""
+
+import pytest
+
+from main import ChatbotWithMemory, conversation_store, response_cache
+
+
+@pytest.fixture(scope="session")
+def chatbot():
+    """Create one chatbot instance for the whole test session."""
+    return ChatbotWithMemory()
+
+
+@pytest.fixture(autouse=True)
+async def _reset_store():
+    """Empty the global conversation store and response cache before each test."""
+    await conversation_store.clear_all()
+    await response_cache.clear()
+    yield
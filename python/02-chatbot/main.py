@@ -5,60 +5,537 @@ This example demonstrates:
 - Conversation memory across multiple runs
 - Using thread_id to track conversation context
 - LLM integration with conversation history
-- Simple in-memory conversation store
+- In-memory or Redis-backed conversation store
 """
 
+import asyncio
+import logging
+import logging.handlers
 import os
+import queue
+import sys
+import threading
 from collections import defaultdict
-from typing import Any
+from collections.abc import Sequence
+from hashlib import blake2b
+from typing import Protocol, TypedDict
+
+import msgspec
+from redis.asyncio import Redis
 
 from duragraph import Graph, node
 from duragraph.worker import Worker
 
+from _responder import echo_response, normalize_message, rule_based_response
+
+
+# Number of trailing messages used as context for a response
+CONTEXT_WINDOW = 5
+
+# Idle threads expire from Redis after this many seconds
+THREAD_TTL_SECONDS = int(os.getenv("CHATBOT_THREAD_TTL", str(7 * 24 * 60 * 60)))
+
+# Identifies the response backend; part of every response cache key
+MODEL_ID = os.getenv("CHATBOT_MODEL", "rule-based")
+
+# Cached responses expire after this many seconds
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("CHATBOT_RESPONSE_CACHE_TTL", "3600"))
+
+# Run each turn as a single node (set CHATBOT_FUSED=0 for the four-node chain)
+FUSED = os.getenv("CHATBOT_FUSED", "1") == "1"
+
+# Node logs below this level are skipped before any formatting happens
+LOG_LEVEL = os.getenv("CHATBOT_LOG_LEVEL", "INFO").upper()
+
+# Log records waiting for the writer thread; further records are dropped
+LOG_QUEUE_SIZE = 8192
+
+logger = logging.getLogger("chatbot")
+
+
+class Message(msgspec.Struct, array_like=True):
+    """A persisted message, encoded as a compact ["role", "content"] array."""
+
+    role: str
+    content: str
+
+
+_encoder = msgspec.json.Encoder()
+_message_decoder = msgspec.json.Decoder(Message)
+
+
+# Message roles; every stored and loaded message shares these string objects
+ROLE_SYSTEM = "system"
+ROLE_USER = "user"
+ROLE_ASSISTANT = "assistant"
+
+# Roles are stored as a single byte per message
+_ROLE_CODES = {ROLE_SYSTEM: ord("s"), ROLE_USER: ord("u"), ROLE_ASSISTANT: ord("a")}
+_ROLE_NAMES = {code: role for role, code in _ROLE_CODES.items()}
+
+# Number of independently locked store shards (must be a power of two)
+_SHARD_COUNT = 64
+
+
+def _role_codes(messages: Sequence[tuple[str, str]]) -> bytearray:
+    """Return the role codes of (role, content) messages, rejecting unknown roles.
+
+    Stores call this before writing anything, so a batch with an unknown
+    role is rejected whole whichever store is in use.
+    """
+    codes = bytearray()
+    for role, _ in messages:
+        code = _ROLE_CODES.get(role)
+        if code is None:
+            raise ValueError(f"Unknown message role: {role!r}")
+        codes.append(code)
+    return codes
+
+
+class ConversationBackend(Protocol):
+    """Interface shared by the in-memory and Redis conversation stores."""
+
+    async def get_messages(
+        self, thread_id: str, n: int | None = None
+    ) -> tuple[dict[str, str], ...]: ...
+
+    async def get_context(
+        self, thread_id: str, n: int
+    ) -> tuple[tuple[dict[str, str], ...], int]: ...
+
+    async def count_messages(self, thread_id: str) -> int: ...
+
+    async def add_message(self, thread_id: str, role: str, content: str) -> None: ...
+
+    async def add_messages(
+        self, thread_id: str, messages: Sequence[tuple[str, str]]
+    ) -> None: ...
+
+    async def clear(self, thread_id: str) -> None: ...
+
+    async def clear_all(self) -> None: ...
+
+
+class ResponseCacheBackend(Protocol):
+    """Interface shared by the in-memory and Redis response caches."""
+
+    async def get(self, key: str) -> str | None: ...
+
+    async def set(self, key: str, response: str, ttl: int) -> None: ...
+
+    async def clear(self) -> None: ...
+
 
 # Simple in-memory conversation store
-# In production, use Redis, PostgreSQL, or another persistent store
+# Used when REDIS_URL is not set (local development and tests)
 class ConversationStore:
     """Stores conversation history by thread_id."""
 
-    def __init__(self):
-        self._store: dict[str, list[dict[str, str]]] = defaultdict(list)
+    def __init__(self) -> None:
+        # Threads are spread over shards with a lock each, so workers writing
+        # to different threads rarely wait on each other. Within a shard every
+        # thread is a column per field instead of a dict per message.
+        self._locks = [threading.Lock() for _ in range(_SHARD_COUNT)]
+        self._roles: list[dict[str, bytearray]] = [
+            defaultdict(bytearray) for _ in range(_SHARD_COUNT)
+        ]
+        self._contents: list[dict[str, list[str]]] = [
+            defaultdict(list) for _ in range(_SHARD_COUNT)
+        ]
+
+    @staticmethod
+    def _shard(thread_id: str) -> int:
+        return hash(thread_id) & (_SHARD_COUNT - 1)
+
+    async def get_messages(
+        self, thread_id: str, n: int | None = None
+    ) -> tuple[dict[str, str], ...]:
+        """Retrieve conversation history for a thread, or only its last n messages."""
+        shard = self._shard(thread_id)
+        with self._locks[shard]:
+            contents = self._contents[shard].get(thread_id)
+            if not contents or (n is not None and n <= 0):
+                return ()
+            start = 0 if n is None else max(len(contents) - n, 0)
+            roles = self._roles[shard][thread_id][start:]
+            contents = contents[start:]
+        return tuple(
+            {"role": _ROLE_NAMES[code], "content": content}
+            for code, content in zip(roles, contents)
+        )
+
+    async def count_messages(self, thread_id: str) -> int:
+        """Return the number of messages stored for a thread."""
+        shard = self._shard(thread_id)
+        with self._locks[shard]:
+            return len(self._contents[shard].get(thread_id, ()))
 
-    def get_messages(self, thread_id: str) -> list[dict[str, str]]:
-        """Retrieve conversation history for a thread."""
-        return self._store[thread_id].copy()
+    async def get_context(
+        self, thread_id: str, n: int
+    ) -> tuple[tuple[dict[str, str], ...], int]:
+        """Return the last n messages of a thread and its total message count."""
+        shard = self._shard(thread_id)
+        with self._locks[shard]:
+            roles = self._roles[shard].get(thread_id, b"")
+            contents = self._contents[shard].get(thread_id, [])
+            total = len(contents)
+            start = max(total - n, 0) if n > 0 else total
+            roles, contents = roles[start:], contents[start:]
+        messages = tuple(
+            {"role": _ROLE_NAMES[code], "content": content}
+            for code, content in zip(roles, contents)
+        )
+        return messages, total
 
-    def add_message(self, thread_id: str, role: str, content: str) -> None:
+    async def add_message(self, thread_id: str, role: str, content: str) -> None:
         """Add a message to conversation history."""
-        self._store[thread_id].append({"role": role, "content": content})
+        await self.add_messages(thread_id, [(role, content)])
+
+    async def add_messages(
+        self, thread_id: str, messages: Sequence[tuple[str, str]]
+    ) -> None:
+        """Add several (role, content) messages to conversation history at once."""
+        codes = _role_codes(messages)
+        shard = self._shard(thread_id)
+        with self._locks[shard]:
+            self._roles[shard][thread_id] += codes
+            self._contents[shard][thread_id].extend(content for _, content in messages)
+
+    async def clear(self, thread_id: str) -> None:
+        """Clear conversation history for a thread."""
+        shard = self._shard(thread_id)
+        with self._locks[shard]:
+            self._roles[shard].pop(thread_id, None)
+            self._contents[shard].pop(thread_id, None)
 
-    def clear(self, thread_id: str) -> None:
+    async def clear_all(self) -> None:
+        """Clear conversation history for every thread."""
+        for lock, roles, contents in zip(self._locks, self._roles, self._contents):
+            with lock:
+                roles.clear()
+                contents.clear()
+
+
+async def _delete_matching(redis: Redis, pattern: str) -> None:
+    """Delete every key matching pattern, scanning instead of blocking on KEYS."""
+    batch: list[bytes] = []
+    async for key in redis.scan_iter(match=pattern, count=500):
+        batch.append(key)
+        if len(batch) >= 500:
+            await redis.delete(*batch)
+            batch.clear()
+    if batch:
+        await redis.delete(*batch)
+
+
+# Redis-backed conversation store
+# Each thread is a Redis list, so history survives restarts and is shared
+# by every worker process pointed at the same Redis instance
+class RedisConversationStore:
+    """Stores conversation history by thread_id in Redis lists."""
+
+    def __init__(self, redis: Redis, ttl: int = THREAD_TTL_SECONDS) -> None:
+        self._redis = redis
+        self._ttl = ttl
+
+    @staticmethod
+    def _key(thread_id: str) -> str:
+        return f"thread:{thread_id}"
+
+    async def get_messages(
+        self, thread_id: str, n: int | None = None
+    ) -> tuple[dict[str, str], ...]:
+        """Retrieve conversation history for a thread, or only its last n messages."""
+        if n is not None and n <= 0:
+            return ()
+        start = 0 if n is None else -n
+        items = await self._redis.lrange(self._key(thread_id), start, -1)
+        return tuple(
+            {"role": sys.intern(message.role), "content": message.content}
+            for message in map(_message_decoder.decode, items)
+        )
+
+    async def count_messages(self, thread_id: str) -> int:
+        """Return the number of messages stored for a thread."""
+        return await self._redis.llen(self._key(thread_id))
+
+    async def get_context(
+        self, thread_id: str, n: int
+    ) -> tuple[tuple[dict[str, str], ...], int]:
+        """Return the last n messages of a thread and its total message count."""
+        if n <= 0:
+            return (), await self.count_messages(thread_id)
+        key = self._key(thread_id)
+        # LRANGE and LLEN go out in one MULTI/EXEC on one connection, so the
+        # count always matches the tail even while other workers append
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.lrange(key, -n, -1)
+            pipe.llen(key)
+            items, total = await pipe.execute()
+        messages = tuple(
+            {"role": sys.intern(message.role), "content": message.content}
+            for message in map(_message_decoder.decode, items)
+        )
+        return messages, total
+
+    async def add_message(self, thread_id: str, role: str, content: str) -> None:
+        """Append a message and refresh the thread's expiry."""
+        await self.add_messages(thread_id, [(role, content)])
+
+    async def add_messages(
+        self, thread_id: str, messages: Sequence[tuple[str, str]]
+    ) -> None:
+        """Append several (role, content) messages in a single round trip."""
+        # RPUSH needs at least one value; an empty batch is a no-op as in memory
+        if not _role_codes(messages):
+            return
+        key = self._key(thread_id)
+        encoded = [_encoder.encode(Message(role, content)) for role, content in messages]
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.rpush(key, *encoded)
+            pipe.expire(key, self._ttl)
+            await pipe.execute()
+
+    async def clear(self, thread_id: str) -> None:
         """Clear conversation history for a thread."""
-        if thread_id in self._store:
-            del self._store[thread_id]
+        await self._redis.delete(self._key(thread_id))
+
+    async def clear_all(self) -> None:
+        """Clear conversation history for every thread."""
+        await _delete_matching(self._redis, self._key("*"))
+
 
+def response_cache_key(model_id: str, messages: Sequence[dict[str, str]]) -> str:
+    """Hash a model and its conversation context into a response cache key."""
+    digest = blake2b(_encoder.encode([model_id, messages]), digest_size=16)
+    return "resp:" + digest.hexdigest()
 
-# Global store instance (shared across graph executions)
-conversation_store = ConversationStore()
+
+# Simple in-memory response cache
+# Bounded by entry count; the oldest entry is evicted first. Writes take a
+# lock, since worker threads share the cache just as they share the store.
+class ResponseCache:
+    """Caches generated responses by context hash."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, str] = {}
+        self._max_entries = max_entries
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached response for a key, if any."""
+        return self._entries.get(key)
+
+    async def set(self, key: str, response: str, ttl: int) -> None:
+        """Cache a response (ttl is ignored in memory)."""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = response
+
+    async def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Redis-backed response cache, shared by every worker
+class RedisResponseCache:
+    """Caches generated responses by context hash in Redis."""
+
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached response for a key, if any."""
+        value = await self._redis.get(key)
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def set(self, key: str, response: str, ttl: int) -> None:
+        """Cache a response for ttl seconds."""
+        await self._redis.set(key, response, ex=ttl)
+
+    async def clear(self) -> None:
+        """Drop every cached response."""
+        await _delete_matching(self._redis, "resp:*")
+
+
+# Global store and cache instances (shared across graph executions)
+conversation_store: ConversationBackend
+response_cache: ResponseCacheBackend
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    _redis = Redis.from_url(REDIS_URL)
+    conversation_store = RedisConversationStore(_redis)
+    response_cache = RedisResponseCache(_redis)
+else:
+    conversation_store = ConversationStore()
+    response_cache = ResponseCache()
+
+
+# Per-thread user profiles (stands in for a user service or database)
+user_profiles: dict[str, dict[str, str]] = {}
+
+
+async def load_context(thread_id: str) -> tuple[tuple[dict[str, str], ...], int]:
+    """Load the tail of a thread and the thread's total message count."""
+    # Both come from one snapshot of the thread in a single store round trip
+    return await conversation_store.get_context(thread_id, CONTEXT_WINDOW)
+
+
+async def load_user_profile(thread_id: str) -> dict[str, str]:
+    """Look up the profile of the user behind a thread (empty if unknown)."""
+    return dict(user_profiles.get(thread_id, {}))
+
+
+async def load_turn_inputs(
+    thread_id: str,
+) -> tuple[tuple[dict[str, str], ...], int, dict[str, str]]:
+    """Load the context tail, message count and user profile for a turn."""
+    # The history and the profile don't depend on each other, so fetch them
+    # together: the turn waits for the slower lookup, not for both in turn
+    (messages, total), profile = await asyncio.gather(
+        load_context(thread_id), load_user_profile(thread_id)
+    )
+    return messages, total, profile
+
+
+async def cache_response(cache_key: str | None, response: str) -> None:
+    """Store a response in the cache, if it has a key; failures are only logged."""
+    if cache_key is None:
+        return
+    # The cache only saves work on later turns, so a failed write must not
+    # fail (and get retried with) a turn whose history is already saved
+    try:
+        await response_cache.set(cache_key, response, RESPONSE_CACHE_TTL_SECONDS)
+    except Exception:
+        logger.warning("Could not cache response %s", cache_key, exc_info=True)
+
+
+async def generate_reply(
+    messages: Sequence[dict[str, str]], message_count: int, metrics: dict[str, int]
+) -> tuple[str, str | None]:
+    """Generate a response for the conversation tail in messages.
+
+    message_count is the length of the whole conversation, which may be
+    longer than the loaded tail. Returns the response together with the
+    cache key it should be stored under, or None if it must not be cached;
+    the caller writes the cache so it can overlap that write with others.
+    """
+    # Simulate LLM response (in real implementation, call OpenAI/Anthropic
+    # with the context window as the prompt)
+    window = messages[-CONTEXT_WINDOW:]
+    
+    # Identical context for the same model means an identical response,
+    # so repeated conversation openers skip generation entirely
+    cache_key = response_cache_key(MODEL_ID, window)
+    response = await response_cache.get(cache_key)
+    if response is not None:
+        metrics["cache_hit"] = metrics.get("cache_hit", 0) + 1
+        return response, None
+    
+    metrics["cache_miss"] = metrics.get("cache_miss", 0) + 1
+    # Simple rule-based response for demo (replace with real LLM)
+    user_message = normalize_message(messages[-1]["content"]) if messages else ""
+    response = rule_based_response(user_message)
+    if response is not None:
+        return response, cache_key
+    
+    # Echo with context awareness (depends on the message count, so never cached)
+    return echo_response(messages[-1]["content"], message_count), None
+
+
+class ChatState(TypedDict, total=False):
+    """Run state passed between the chatbot's nodes."""
+
+    thread_id: str
+    input: str
+    # Read-only tuple from the store until a node adds a message
+    messages: Sequence[dict[str, str]]
+    # Length of the whole conversation, not just the loaded tail
+    message_count: int
+    # Profile of the user behind the thread, loaded alongside the history
+    profile: dict[str, str]
+    response: str
+    _metrics: dict[str, int]
+
+
+def _chain_node(func):
+    """Register func as a graph node only when turns are not fused."""
+    return func if FUSED else node(func)
+
+
+def _fused_node(func):
+    """Register func as a graph node only when turns are fused."""
+    return node(func) if FUSED else func
 
 
 @Graph
 class ChatbotWithMemory:
     """A chatbot that maintains conversation history using thread_id."""
 
-    @node
-    async def load_history(self, state: dict[str, Any]) -> dict[str, Any]:
+    @_fused_node
+    async def turn(self, state: ChatState) -> ChatState:
+        """Run a whole turn: load history, add the message, respond and save."""
+        thread_id = state.get("thread_id", "default")
+        user_input = state.get("input", "")
+        
+        # Nothing to answer: end the run without touching the store
+        if not user_input:
+            return state
+        
+        history, message_count, profile = await load_turn_inputs(thread_id)
+        logger.info("[load_history] Thread: %s, Messages: %d", thread_id, message_count)
+        
+        # The loaded history is read-only; the turn appends to its own copy
+        messages = list(history)
+        messages.append({"role": ROLE_USER, "content": user_input})
+        message_count += 1
+        logger.info("[add_user_message] User: %s", user_input)
+        
+        response, cache_key = await generate_reply(
+            messages, message_count, state.setdefault("_metrics", {})
+        )
+        logger.info("[generate_response] Assistant: %s", response)
+        
+        messages.append({"role": ROLE_ASSISTANT, "content": response})
+        message_count += 1
+        # Saving the turn and caching the response are independent writes,
+        # so they share one round trip's worth of latency. Only the history
+        # write can fail the turn; cache_response never raises.
+        await asyncio.gather(
+            conversation_store.add_messages(
+                thread_id, [(ROLE_USER, user_input), (ROLE_ASSISTANT, response)]
+            ),
+            cache_response(cache_key, response),
+        )
+        logger.info("[save_response] Saved to thread: %s", thread_id)
+        
+        state["messages"] = messages
+        state["message_count"] = message_count
+        state["profile"] = profile
+        state["response"] = response
+        return state
+
+    @_chain_node
+    async def load_history(self, state: ChatState) -> ChatState:
         """Load conversation history from store."""
         thread_id = state.get("thread_id", "default")
         
-        # Load existing messages for this thread
-        state["messages"] = conversation_store.get_messages(thread_id)
+        # Only the tail of the thread is needed to build a response
+        # message_count tracks the whole thread, not just the loaded tail
+        messages, message_count, profile = await load_turn_inputs(thread_id)
+        state["messages"] = messages
+        state["message_count"] = message_count
+        state["profile"] = profile
         
-        print(f"[load_history] Thread: {thread_id}, Messages: {len(state['messages'])}")
+        logger.info(
+            "[load_history] Thread: %s, Messages: %d", thread_id, state["message_count"]
+        )
         return state
 
-    @node
-    async def add_user_message(self, state: dict[str, Any]) -> dict[str, Any]:
+    @_chain_node
+    async def add_user_message(self, state: ChatState) -> ChatState:
         """Add the user's new message to conversation."""
         user_input = state.get("input", "")
         thread_id = state.get("thread_id", "default")
@@ -66,50 +543,39 @@ class ChatbotWithMemory:
         if not user_input:
             return state
         
-        # Add user message to conversation
-        state["messages"].append({
-            "role": "user",
+        # Add user message to conversation (copying the read-only history)
+        state["message_count"] = state.get("message_count", len(state["messages"])) + 1
+        state["messages"] = [*state["messages"], {
+            "role": ROLE_USER,
             "content": user_input
-        })
+        }]
         
-        print(f"[add_user_message] User: {user_input}")
+        logger.info("[add_user_message] User: %s", user_input)
         return state
 
-    @node
-    async def generate_response(self, state: dict[str, Any]) -> dict[str, Any]:
+    @_chain_node
+    async def generate_response(self, state: ChatState) -> ChatState:
         """Generate AI response based on conversation history."""
         messages = state.get("messages", [])
         
-        # Simulate LLM response (in real implementation, call OpenAI/Anthropic)
-        # Build context from conversation history
-        context = "\n".join([
-            f"{msg['role']}: {msg['content']}" 
-            for msg in messages[-5:]  # Last 5 messages for context
-        ])
-        
-        # Simple rule-based response for demo (replace with real LLM)
-        user_message = messages[-1]["content"].lower() if messages else ""
-        
-        if "hello" in user_message or "hi" in user_message:
-            response = "Hello! How can I help you today?"
-        elif "how are you" in user_message:
-            response = "I'm doing great, thank you for asking! How can I assist you?"
-        elif "bye" in user_message or "goodbye" in user_message:
-            response = "Goodbye! Feel free to come back anytime."
-        elif "name" in user_message:
-            response = "I'm DuraGraph Bot, your helpful assistant!"
-        else:
-            # Echo with context awareness
-            msg_count = len(messages)
-            response = f"I understand you said: '{messages[-1]['content']}'. " \
-                      f"This is message #{msg_count} in our conversation. How can I help further?"
+        # Nothing to answer unless the conversation ends with a user message;
+        # save_response then has no response to save and returns as well
+        if not messages or messages[-1]["role"] != ROLE_USER:
+            return state
+        
+        response, cache_key = await generate_reply(
+            messages,
+            state.get("message_count", len(messages)),
+            state.setdefault("_metrics", {}),
+        )
+        await cache_response(cache_key, response)
         
         state["response"] = response
-        print(f"[generate_response] Assistant: {response}")
+        logger.info("[generate_response] Assistant: %s", response)
         return state
 
-    @node
-    async def save_response(self, state: dict[str, Any]) -> dict[str, Any]:
+    @_chain_node
+    async def save_response(self, state: ChatState) -> ChatState:
         """Save assistant response to conversation history."""
         thread_id = state.get("thread_id", "default")
         response = state.get("response", "")
@@ -118,20 +584,57 @@ class ChatbotWithMemory:
             return state
         
         # Add assistant message to state
-        state["messages"].append({
-            "role": "assistant",
+        state["message_count"] = state.get("message_count", len(state["messages"])) + 1
+        state["messages"] = [*state["messages"], {
+            "role": ROLE_ASSISTANT,
             "content": response
-        })
+        }]
         
-        # Persist both user message and response
-        conversation_store.add_message(thread_id, "user", state.get("input", ""))
-        conversation_store.add_message(thread_id, "assistant", response)
+        # Persist both user message and response in one write
+        await conversation_store.add_messages(
+            thread_id,
+            [(ROLE_USER, state.get("input", "")), (ROLE_ASSISTANT, response)],
+        )
         
-        print(f"[save_response] Saved to thread: {thread_id}")
+        logger.info("[save_response] Saved to thread: %s", thread_id)
         return state
 
 
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue records as-is and drop them when the queue is full."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting happens on the listener thread, not in the node
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def configure_logging() -> logging.handlers.QueueListener:
+    """Route node logs through a bounded queue to a background writer thread."""
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(LOG_QUEUE_SIZE)
+    logger.addHandler(_DroppingQueueHandler(log_queue))
+    logger.setLevel(LOG_LEVEL)
+    logger.propagate = False
+    
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(logging.Formatter("%(message)s"))
+    return logging.handlers.QueueListener(log_queue, output)
+
+
 def main():
+    # Use uvloop's faster event loop for node dispatch when it's installed
+    try:
+        import uvloop
+    except ImportError:  # optional: not available on Windows
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     # Get control plane URL from environment
     control_plane_url = os.getenv("DURAGRAPH_URL", "http://localhost:8081")
 
@@ -153,8 +656,14 @@ def main():
     print("Press Ctrl+C to stop")
     print()
 
-    # Run the worker (blocks until stopped)
-    worker.run()
+    # Node logs are written by a background thread while the worker runs
+    log_listener = configure_logging()
+    log_listener.start()
+    try:
+        # Run the worker (blocks until stopped)
+        worker.run()
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -5,86 +5,425 @@ Since this is a worker example, we test the core logic without
 requiring a full DuraGraph deployment.
 """
 
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from fakeredis import FakeAsyncRedis
 from unittest.mock import patch, MagicMock
-from main import ConversationStore, ChatbotWithMemory
+from main import (
+    CONTEXT_WINDOW,
+    ConversationStore,
+    Message,
+    RedisConversationStore,
+    _DroppingQueueHandler,
+    RedisResponseCache,
+    ResponseCache,
+    _encoder,
+    _message_decoder,
+    conversation_store,
+)
+from _responder import normalize_message, rule_based_response
 
 
 class TestConversationStore:
     """Test the conversation store functionality."""
     
-    def test_empty_store(self):
+    @pytest.mark.asyncio
+    async def test_empty_store(self):
         """Test store starts empty."""
         store = ConversationStore()
-        messages = store.get_messages("test_thread")
-        assert messages == []
+        messages = await store.get_messages("test_thread")
+        assert messages == ()
     
-    def test_add_and_get_messages(self):
+    @pytest.mark.asyncio
+    async def test_add_and_get_messages(self):
         """Test adding and retrieving messages."""
         store = ConversationStore()
         
         # Add messages
-        store.add_message("thread1", "user", "Hello")
-        store.add_message("thread1", "assistant", "Hi there!")
+        await store.add_message("thread1", "user", "Hello")
+        await store.add_message("thread1", "assistant", "Hi there!")
         
         # Retrieve messages
-        messages = store.get_messages("thread1")
+        messages = await store.get_messages("thread1")
         assert len(messages) == 2
         assert messages[0] == {"role": "user", "content": "Hello"}
         assert messages[1] == {"role": "assistant", "content": "Hi there!"}
     
-    def test_thread_isolation(self):
+    @pytest.mark.asyncio
+    async def test_thread_isolation(self):
         """Test that different threads have separate conversations."""
         store = ConversationStore()
         
         # Add to different threads
-        store.add_message("thread1", "user", "Hello from thread 1")
-        store.add_message("thread2", "user", "Hello from thread 2")
+        await store.add_message("thread1", "user", "Hello from thread 1")
+        await store.add_message("thread2", "user", "Hello from thread 2")
         
         # Check isolation
-        messages1 = store.get_messages("thread1")
-        messages2 = store.get_messages("thread2")
+        messages1 = await store.get_messages("thread1")
+        messages2 = await store.get_messages("thread2")
         
         assert len(messages1) == 1
         assert len(messages2) == 1
         assert messages1[0]["content"] == "Hello from thread 1"
         assert messages2[0]["content"] == "Hello from thread 2"
     
-    def test_clear_conversation(self):
+    @pytest.mark.asyncio
+    async def test_clear_conversation(self):
         """Test clearing conversation history."""
         store = ConversationStore()
         
         # Add messages
-        store.add_message("test", "user", "Hello")
-        assert len(store.get_messages("test")) == 1
+        await store.add_message("test", "user", "Hello")
+        assert len(await store.get_messages("test")) == 1
         
         # Clear and check
-        store.clear("test")
-        assert len(store.get_messages("test")) == 0
+        await store.clear("test")
+        assert len(await store.get_messages("test")) == 0
     
-    def test_get_messages_returns_copy(self):
-        """Test that get_messages returns a copy, not reference."""
+    @pytest.mark.asyncio
+    async def test_get_messages_returns_immutable(self):
+        """Test that get_messages returns a read-only snapshot."""
         store = ConversationStore()
-        store.add_message("test", "user", "Hello")
+        await store.add_message("test", "user", "Hello")
         
-        messages1 = store.get_messages("test")
-        messages2 = store.get_messages("test")
+        messages = await store.get_messages("test")
         
-        # Modify one copy
-        messages1.append({"role": "assistant", "content": "Modified"})
+        assert isinstance(messages, tuple)
+        with pytest.raises(AttributeError):
+            messages.append({"role": "assistant", "content": "Modified"})
         
-        # Original should be unchanged
-        assert len(messages2) == 1
-        assert len(store.get_messages("test")) == 1
+        # Changing a returned message doesn't change the store
+        messages[0]["content"] = "Modified"
+        assert (await store.get_messages("test"))[0]["content"] == "Hello"
+    
+    @pytest.mark.asyncio
+    async def test_add_messages_batch(self):
+        """Test adding several messages in one call."""
+        store = ConversationStore()
+        
+        await store.add_messages("test", [("user", "Hello"), ("assistant", "Hi there!")])
+        
+        assert await store.get_messages("test") == (
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there!"},
+        )
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "make_store",
+        [ConversationStore, lambda: RedisConversationStore(FakeAsyncRedis())],
+        ids=["memory", "redis"],
+    )
+    async def test_add_messages_empty_batch(self, make_store):
+        """Test that an empty batch is a no-op in every store."""
+        store = make_store()
+        
+        await store.add_messages("test", [])
+        
+        assert await store.count_messages("test") == 0
+        assert await store.get_messages("test") == ()
+    
+    @pytest.mark.asyncio
+    async def test_add_messages_batch_rejected_whole(self):
+        """Test that a batch with an unknown role stores nothing."""
+        store = ConversationStore()
+        
+        with pytest.raises(ValueError):
+            await store.add_messages("test", [("user", "Hello"), ("narrator", "...")])
+        assert await store.count_messages("test") == 0
+    
+    @pytest.mark.asyncio
+    async def test_unknown_role_rejected(self):
+        """Test that only system, user and assistant roles are accepted."""
+        store = ConversationStore()
+        
+        with pytest.raises(ValueError):
+            await store.add_message("test", "narrator", "Once upon a time")
+        assert await store.count_messages("test") == 0
+    
+    def test_concurrent_writers(self):
+        """Test that worker threads writing at the same time lose or mix no messages."""
+        store = ConversationStore()
+        
+        class YieldingBatch(list):
+            """A batch that lets other threads run between its messages."""
+            
+            def __iter__(self):
+                for message in super().__iter__():
+                    time.sleep(0)
+                    yield message
+        
+        def write(worker):
+            async def run():
+                for i in range(50):
+                    await store.add_messages(
+                        f"thread{worker % 4}",
+                        YieldingBatch(
+                            pair
+                            for j in range(10)
+                            for pair in (("user", f"{worker}-{i}-{j}"), ("assistant", "ok"))
+                        ),
+                    )
+            asyncio.run(run())
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(write, range(8)))
+        
+        for t in range(4):
+            messages = asyncio.run(store.get_messages(f"thread{t}"))
+            # Two writers per thread, each adding 500 user/assistant pairs
+            assert [m["role"] for m in messages] == ["user", "assistant"] * 1000
+            # The role and content columns must stay in step: every batch is
+            # stored in one piece, each content next to the role it came with
+            for start in range(0, 2000, 20):
+                batch = messages[start:start + 20]
+                worker, i = batch[0]["content"].split("-")[:2]
+                assert int(worker) % 4 == t
+                assert [m["content"] for m in batch] == [
+                    content
+                    for j in range(10)
+                    for content in (f"{worker}-{i}-{j}", "ok")
+                ]
+    
+    @pytest.mark.asyncio
+    async def test_get_last_n_messages(self):
+        """Test that only the requested tail of the history is returned."""
+        store = ConversationStore()
+        for i in range(8):
+            await store.add_message("test", "user", f"Message {i}")
+        
+        messages = await store.get_messages("test", n=3)
+        
+        assert [m["content"] for m in messages] == ["Message 5", "Message 6", "Message 7"]
+        assert await store.count_messages("test") == 8
+        assert await store.get_messages("test", n=0) == ()
+    
+    @pytest.mark.asyncio
+    async def test_get_context(self):
+        """Test that the tail and the total count are read together."""
+        store = ConversationStore()
+        for i in range(8):
+            await store.add_message("test", "user", f"Message {i}")
+        
+        messages, total = await store.get_context("test", 3)
+        
+        assert [m["content"] for m in messages] == ["Message 5", "Message 6", "Message 7"]
+        assert total == 8
+        assert await store.get_context("test", 0) == ((), 8)
+        assert await store.get_context("missing", 3) == ((), 0)
 
 
-class TestChatbotGraph:
-    """Test the chatbot graph nodes."""
+class TestMessageCodec:
+    """Test the persisted message encoding."""
+    
+    def test_message_round_trip(self):
+        """Test that messages encode as compact arrays and decode back."""
+        encoded = _encoder.encode(Message("user", "Hello"))
+        
+        assert encoded == b'["user","Hello"]'
+        assert _message_decoder.decode(encoded) == Message("user", "Hello")
+
+
+class TestRedisConversationStore:
+    """Test the Redis-backed conversation store against a fake Redis."""
     
     @pytest.fixture
-    def chatbot(self):
-        """Create chatbot instance for testing."""
-        return ChatbotWithMemory()
+    def redis(self):
+        return FakeAsyncRedis()
+    
+    @pytest.mark.asyncio
+    async def test_add_and_get_messages(self, redis):
+        """Test that messages round-trip through Redis as compact arrays."""
+        store = RedisConversationStore(redis)
+        
+        await store.add_messages("thread1", [("user", "Hello"), ("assistant", "Hi there!")])
+        
+        assert await redis.lrange("thread:thread1", 0, -1) == [
+            b'["user","Hello"]',
+            b'["assistant","Hi there!"]',
+        ]
+        assert await store.get_messages("thread1") == (
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there!"},
+        )
+        assert await store.count_messages("thread1") == 2
+    
+    @pytest.mark.asyncio
+    async def test_get_last_n_messages(self, redis):
+        """Test that only the requested tail of the thread is read."""
+        store = RedisConversationStore(redis)
+        for i in range(8):
+            await store.add_message("test", "user", f"Message {i}")
+        
+        messages = await store.get_messages("test", n=3)
+        
+        assert [m["content"] for m in messages] == ["Message 5", "Message 6", "Message 7"]
+        assert len(await store.get_messages("test", n=20)) == 8
+        assert await store.get_messages("test", n=0) == ()
+    
+    @pytest.mark.asyncio
+    async def test_get_context(self, redis):
+        """Test that the tail and the total count come from one transaction."""
+        store = RedisConversationStore(redis)
+        for i in range(8):
+            await store.add_message("test", "user", f"Message {i}")
+        
+        messages, total = await store.get_context("test", 3)
+        
+        assert [m["content"] for m in messages] == ["Message 5", "Message 6", "Message 7"]
+        assert total == 8
+        assert await store.get_context("test", 0) == ((), 8)
+        assert await store.get_context("missing", 3) == ((), 0)
+    
+    @pytest.mark.asyncio
+    async def test_unknown_role_rejected(self, redis):
+        """Test that only system, user and assistant roles are accepted."""
+        store = RedisConversationStore(redis)
+        
+        with pytest.raises(ValueError):
+            await store.add_message("test", "narrator", "Once upon a time")
+        assert await store.count_messages("test") == 0
+    
+    @pytest.mark.asyncio
+    async def test_add_messages_batch_rejected_whole(self, redis):
+        """Test that a batch with an unknown role stores nothing."""
+        store = RedisConversationStore(redis)
+        
+        with pytest.raises(ValueError):
+            await store.add_messages("test", [("user", "Hello"), ("narrator", "...")])
+        assert await store.count_messages("test") == 0
+    
+    @pytest.mark.asyncio
+    async def test_thread_expires(self, redis):
+        """Test that every write refreshes the thread's expiry."""
+        store = RedisConversationStore(redis, ttl=60)
+        
+        await store.add_message("test", "user", "Hello")
+        
+        assert 0 < await redis.ttl("thread:test") <= 60
+    
+    @pytest.mark.asyncio
+    async def test_clear_conversation(self, redis):
+        """Test clearing conversation history."""
+        store = RedisConversationStore(redis)
+        await store.add_message("test", "user", "Hello")
+        
+        await store.clear("test")
+        
+        assert await store.get_messages("test") == ()
+        assert await store.count_messages("test") == 0
+    
+    @pytest.mark.asyncio
+    async def test_clear_all(self, redis):
+        """Test that clearing every thread leaves other keys alone."""
+        store = RedisConversationStore(redis)
+        for t in range(3):
+            await store.add_message(f"thread{t}", "user", "Hello")
+        await redis.set("resp:key", "cached")
+        
+        await store.clear_all()
+        
+        assert await redis.keys("thread:*") == []
+        assert await redis.get("resp:key") == b"cached"
+
+
+class TestResponseCache:
+    """Test the in-memory response cache."""
+    
+    @pytest.mark.asyncio
+    async def test_evicts_oldest(self):
+        """Test that the oldest entry makes room once the cache is full."""
+        cache = ResponseCache(max_entries=2)
+        await cache.set("a", "A", ttl=60)
+        await cache.set("b", "B", ttl=60)
+        await cache.set("c", "C", ttl=60)
+        
+        assert await cache.get("a") is None
+        assert await cache.get("b") == "B"
+        assert await cache.get("c") == "C"
+    
+    def test_concurrent_writers(self):
+        """Test that worker threads evicting at the same time stay within bounds."""
+        cache = ResponseCache(max_entries=4)
+        
+        def write(worker):
+            async def run():
+                for i in range(500):
+                    await cache.set(f"{worker}-{i}", "ok", ttl=60)
+            asyncio.run(run())
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(write, range(8)))
+        
+        assert len(cache._entries) == 4
+
+
+class TestRedisResponseCache:
+    """Test the Redis-backed response cache against a fake Redis."""
+    
+    @pytest.mark.asyncio
+    async def test_set_and_get(self):
+        """Test that cached responses come back as strings with a TTL."""
+        redis = FakeAsyncRedis()
+        cache = RedisResponseCache(redis)
+        
+        assert await cache.get("resp:missing") is None
+        await cache.set("resp:key", "Hello! How can I help you today?", ttl=60)
+        
+        assert await cache.get("resp:key") == "Hello! How can I help you today?"
+        assert 0 < await redis.ttl("resp:key") <= 60
+        
+        await cache.clear()
+        assert await cache.get("resp:key") is None
+
+
+class TestLogging:
+    """Test the queued node log handler."""
+    
+    @staticmethod
+    def _record(message, *args):
+        return logging.LogRecord("chatbot", logging.INFO, __file__, 1, message, args, None)
+    
+    def test_prepare_leaves_record_unformatted(self):
+        """Test that records are queued as-is, to be formatted by the listener."""
+        handler = _DroppingQueueHandler(queue.Queue(1))
+        record = self._record("[save_response] Saved to thread: %s", "alice")
+        
+        prepared = handler.prepare(record)
+        
+        assert prepared is record
+        assert prepared.msg == "[save_response] Saved to thread: %s"
+        assert prepared.args == ("alice",)
+        assert not hasattr(prepared, "message")
+    
+    def test_full_queue_drops_records(self):
+        """Test that a record is dropped, not waited on, when the queue is full."""
+        log_queue = queue.Queue(1)
+        handler = _DroppingQueueHandler(log_queue)
+        handler.handleError = MagicMock()
+        first = self._record("first")
+        
+        writer = threading.Thread(
+            target=lambda: [handler.handle(first), handler.handle(self._record("second"))]
+        )
+        writer.start()
+        writer.join(timeout=5)
+        
+        assert not writer.is_alive()
+        assert log_queue.get_nowait() is first
+        assert log_queue.empty()
+        # Dropping is expected, not a logging error to report on stderr
+        handler.handleError.assert_not_called()
+
+
+class TestChatbotGraph:
+    """Test the chatbot graph nodes."""
     
     @pytest.fixture
     def sample_state(self):
@@ -99,7 +438,7 @@ class TestChatbotGraph:
     async def test_load_history(self, chatbot, sample_state):
         """Test loading conversation history."""
         # Add some history first
-        conversation_store.add_message("test_thread", "user", "Previous message")
+        await conversation_store.add_message("test_thread", "user", "Previous message")
         
         # Load history
         result = await chatbot.load_history(sample_state)
@@ -107,9 +446,30 @@ class TestChatbotGraph:
         assert "messages" in result
         assert len(result["messages"]) >= 1
         assert result["messages"][-1]["content"] == "Previous message"
+    
+    @pytest.mark.asyncio
+    async def test_load_history_window(self, chatbot, sample_state):
+        """Test that only the context window is loaded for long threads."""
+        for i in range(12):
+            await conversation_store.add_message("test_thread", "user", f"Message {i}")
+        
+        result = await chatbot.load_history(sample_state)
         
-        # Cleanup
-        conversation_store.clear("test_thread")
+        assert len(result["messages"]) == CONTEXT_WINDOW
+        assert result["messages"][-1]["content"] == "Message 11"
+        assert result["message_count"] == 12
+    
+    @pytest.mark.asyncio
+    async def test_load_history_profile(self, chatbot, sample_state):
+        """Test that the user profile is loaded alongside the history."""
+        await conversation_store.add_message("test_thread", "user", "Previous message")
+        
+        with patch.dict("main.user_profiles", {"test_thread": {"name": "Alice"}}):
+            result = await chatbot.load_history(sample_state)
+        
+        assert result["profile"] == {"name": "Alice"}
+        assert result["messages"][-1]["content"] == "Previous message"
+        assert result["message_count"] == 1
     
     @pytest.mark.asyncio
     async def test_add_user_message(self, chatbot, sample_state):
@@ -166,6 +526,68 @@ class TestChatbotGraph:
         
         assert "duragraph bot" in result["response"].lower()
     
+    def test_rule_priority(self):
+        """Test that the highest-priority rule wins when several keywords match."""
+        assert rule_based_response("what is your name? hi") == \
+            "Hello! How can I help you today?"
+        assert rule_based_response("goodbye, and what was your name?") == \
+            "Goodbye! Feel free to come back anytime."
+        assert rule_based_response("how are you") == \
+            "I'm doing great, thank you for asking! How can I assist you?"
+        assert rule_based_response("tell me a story") is None
+        assert rule_based_response("") is None
+    
+    def test_normalize_message(self):
+        """Test that messages are lowercased without copying lowercase text."""
+        text = "what is your name?"
+        
+        assert normalize_message(text) is text
+        assert normalize_message("What Is Your NAME?") == text
+        assert normalize_message("123 ?!") == "123 ?!"
+    
+    @pytest.mark.asyncio
+    async def test_generate_response_cached(self, chatbot):
+        """Test that a repeated context is served from the response cache."""
+        with patch("main.response_cache", ResponseCache()):
+            first = await chatbot.generate_response(
+                {"messages": [{"role": "user", "content": "Hello"}]}
+            )
+            second = await chatbot.generate_response(
+                {"messages": [{"role": "user", "content": "Hello"}]}
+            )
+        
+        assert first["_metrics"] == {"cache_miss": 1}
+        assert second["_metrics"] == {"cache_hit": 1}
+        assert second["response"] == first["response"]
+    
+    @pytest.mark.asyncio
+    async def test_echo_response_not_cached(self, chatbot):
+        """Test that count-dependent echo responses bypass the cache."""
+        state = {
+            "message_count": 5,
+            "messages": [{"role": "user", "content": "Tell me more"}]
+        }
+        with patch("main.response_cache", ResponseCache()):
+            first = await chatbot.generate_response(dict(state))
+            second = await chatbot.generate_response(dict(state))
+        
+        assert "message #5" in first["response"]
+        assert second["_metrics"] == {"cache_miss": 1}
+    
+    @pytest.mark.asyncio
+    async def test_generate_response_without_user_message(self, chatbot):
+        """Test that nothing is generated when no user message is pending."""
+        state = {
+            "messages": [
+                {"role": "user", "content": "Hello"},
+                {"role": "assistant", "content": "Hi there!"},
+            ]
+        }
+        
+        result = await chatbot.generate_response(state)
+        
+        assert "response" not in result
+    
     @pytest.mark.asyncio
     async def test_save_response(self, chatbot):
         """Test saving response to conversation store."""
@@ -184,11 +606,8 @@ class TestChatbotGraph:
         assert result["messages"][0]["content"] == "Test response"
         
         # Check that it was saved to store
-        stored_messages = conversation_store.get_messages("test_save")
+        stored_messages = await conversation_store.get_messages("test_save")
         assert len(stored_messages) == 2  # user + assistant
-        
-        # Cleanup
-        conversation_store.clear("test_save")
     
     @pytest.mark.asyncio
     async def test_save_response_empty_response(self, chatbot):
@@ -210,9 +629,8 @@ class TestIntegration:
     """Integration tests for the full workflow."""
     
     @pytest.mark.asyncio
-    async def test_full_conversation_flow(self):
+    async def test_full_conversation_flow(self, chatbot):
         """Test a complete conversation workflow."""
-        chatbot = ChatbotWithMemory()
         thread_id = "integration_test"
         
         # Start with empty state
@@ -233,9 +651,10 @@ class TestIntegration:
         assert state["messages"][0]["role"] == "user"
         assert state["messages"][1]["role"] == "assistant"
         assert "response" in state
+        assert state["message_count"] == 2
         
         # Verify persistence
-        stored_messages = conversation_store.get_messages(thread_id)
+        stored_messages = await conversation_store.get_messages(thread_id)
         assert len(stored_messages) == 2
         
         # Second message in same thread
@@ -248,10 +667,90 @@ class TestIntegration:
         state2 = await chatbot.load_history(state2)
         # Should load previous conversation
         assert len(state2["messages"]) == 2
-        
-        # Cleanup
-        conversation_store.clear(thread_id)
-
+        assert state2["message_count"] == 2
 
-# Import the global store from main module
-from main import conversation_store
\ No newline at end of file
+    
+    @pytest.mark.asyncio
+    async def test_fused_turn_matches_chain(self, chatbot):
+        """Test that the fused turn node behaves like the four-node chain."""
+        
+        for user_input in ["Hello!", "What is your name?", "Tell me a story"]:
+            chained = {"thread_id": "chained", "input": user_input, "messages": []}
+            chained = await chatbot.load_history(chained)
+            chained = await chatbot.add_user_message(chained)
+            chained = await chatbot.generate_response(chained)
+            chained = await chatbot.save_response(chained)
+            
+            fused = await chatbot.turn(
+                {"thread_id": "fused", "input": user_input, "messages": []}
+            )
+            
+            assert fused["response"] == chained["response"]
+            assert fused["messages"] == chained["messages"]
+        
+        assert await conversation_store.get_messages("fused") == \
+            await conversation_store.get_messages("chained")
+    
+    @pytest.mark.asyncio
+    async def test_fused_turn_loads_profile(self, chatbot):
+        """Test that the fused turn puts the user profile on state."""
+        await conversation_store.add_message("profiled", "user", "Earlier")
+        
+        with patch.dict("main.user_profiles", {"profiled": {"name": "Alice"}}):
+            result = await chatbot.turn({"thread_id": "profiled", "input": "Hello!"})
+        
+        assert result["profile"] == {"name": "Alice"}
+        assert result["message_count"] == 3
+        assert result["messages"][0]["content"] == "Earlier"
+    
+    @pytest.mark.asyncio
+    async def test_fused_turn_caches_response(self, chatbot):
+        """Test that the fused turn stores rule responses in the cache."""
+        
+        with patch("main.response_cache", ResponseCache()):
+            first = await chatbot.turn(
+                {"thread_id": "cache_a", "input": "Hello!", "messages": []}
+            )
+            second = await chatbot.turn(
+                {"thread_id": "cache_b", "input": "Hello!", "messages": []}
+            )
+        
+        assert first["_metrics"] == {"cache_miss": 1}
+        assert second["_metrics"] == {"cache_hit": 1}
+        assert second["response"] == first["response"]
+    
+    @pytest.mark.asyncio
+    async def test_cache_failure_does_not_fail_turn(self, chatbot):
+        """Test that a failing cache write leaves the turn and its history intact."""
+        
+        class FailingCache(ResponseCache):
+            async def set(self, key, response, ttl):
+                raise ConnectionError("cache unavailable")
+        
+        with patch("main.response_cache", FailingCache()):
+            result = await chatbot.turn(
+                {"thread_id": "cache_down", "input": "Hello!", "messages": []}
+            )
+            chained = {"thread_id": "cache_down_chain", "input": "Hello!", "messages": []}
+            chained = await chatbot.generate_response(
+                await chatbot.add_user_message(await chatbot.load_history(chained))
+            )
+        
+        assert result["response"] == "Hello! How can I help you today?"
+        assert await conversation_store.count_messages("cache_down") == 2
+        assert chained["response"] == result["response"]
+    
+    @pytest.mark.asyncio
+    async def test_empty_input_short_circuits(self, chatbot):
+        """Test that an empty input ends the run without a response or writes."""
+        fused = await chatbot.turn({"thread_id": "empty", "input": ""})
+        
+        chained = {"thread_id": "empty", "input": "", "messages": []}
+        chained = await chatbot.load_history(chained)
+        chained = await chatbot.add_user_message(chained)
+        chained = await chatbot.generate_response(chained)
+        chained = await chatbot.save_response(chained)
+        
+        assert fused == {"thread_id": "empty", "input": ""}
+        assert "response" not in chained
+        assert await conversation_store.count_messages("empty") == 0